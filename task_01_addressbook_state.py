@@ -1,13 +1,105 @@
-from collections import UserDict
-from datetime import datetime, date, timedelta
+from bisect import bisect_left, insort
+from functools import lru_cache, wraps
+from datetime import datetime, date
+from calendar import isleap
+from contextlib import suppress
+from operator import itemgetter
+import os
 import re
 import pickle
+import sys
 from colorama import init as colorama_init, Fore, Style
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.history import InMemoryHistory
 
-colorama_init(autoreset=True)
+if sys.stdout is None or not sys.stdout.isatty():
+    class _NoColor:
+        """Заглушка для Fore/Style, коли вивід не в термінал: ANSI-коди не потрібні."""
+        def __getattr__(self, name):
+            return ""
+
+    Fore = Style = _NoColor()
+elif os.name == "nt":
+    # на Windows ANSI-коди треба перекладати для консолі, на інших ОС термінал розуміє їх сам
+    colorama_init(autoreset=True)
+
+_NON_DIGIT = re.compile(r"\D")
+
+# з якої кількості ДН вмикаємо векторизований підрахунок через numpy
+_VECTORIZE_MIN_RECORDS = 256
+# з якої кількості ДН вмикаємо numba: завантаження/компіляція ядра коштує
+# сотні мс, а виграш проти numpy — лише кілька мс на 100k записів
+_JIT_MIN_RECORDS = 1_000_000
+# кількість днів від початку невисокосного року до першого числа місяця (індекс = місяць)
+_MONTH_START = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# ===================== ПОВІДОМЛЕННЯ =====================
+# кольорові рядки збираємо один раз, а не при кожному виклику хендлера
+
+MSG_NOT_ENOUGH_ARGS = f"{Fore.RED}Недостатньо аргументів для цієї команди.{Style.RESET_ALL}"
+MSG_CONTACT_ADDED = f"{Fore.GREEN}Contact added.{Style.RESET_ALL}"
+MSG_CONTACT_UPDATED = f"{Fore.YELLOW}Contact updated.{Style.RESET_ALL}"
+MSG_CONTACT_NOT_FOUND = f"{Fore.RED}Контакт не знайдено.{Style.RESET_ALL}"
+MSG_CONTACT_NOT_FOUND_ADD_FIRST = (
+    f"{Fore.RED}"
+    "Контакт не знайдено. Спочатку додайте контакт командою: add [ім'я] [телефон]"
+    f"{Style.RESET_ALL}"
+)
+MSG_PHONE_CHANGED = f"{Fore.GREEN}Номер змінено.{Style.RESET_ALL}"
+MSG_OLD_PHONE_NOT_FOUND = f"{Fore.RED}Старий номер не знайдено.{Style.RESET_ALL}"
+MSG_NO_PHONES = f"{Fore.YELLOW}У контакта немає телефонів.{Style.RESET_ALL}"
+MSG_BOOK_EMPTY = f"{Fore.YELLOW}Адресна книга порожня.{Style.RESET_ALL}"
+MSG_BIRTHDAY_NOT_SET = f"{Fore.YELLOW}День народження не встановлено.{Style.RESET_ALL}"
+MSG_NO_UPCOMING_BIRTHDAYS = f"{Fore.YELLOW}Найближчого тижня немає днів народження.{Style.RESET_ALL}"
+MSG_HELLO = f"{Fore.CYAN}Вітаю! Чим можу допомогти?{Style.RESET_ALL}"
+MSG_BYE = f"{Fore.CYAN}До зустрічі!{Style.RESET_ALL}"
+
+_RECORD_FMT = (
+    f"{Fore.CYAN}Contact name: {Fore.YELLOW}{{name}}{Style.RESET_ALL},\n"
+    f"{Fore.CYAN}phones: {Fore.GREEN}{{phones}}{Style.RESET_ALL},\n"
+    f"{Fore.CYAN}birthday: {Fore.MAGENTA}{{bday}}{Style.RESET_ALL}"
+).format
+
+
+def _normalize_phone(raw: str) -> str:
+    """Лишає тільки цифри. Рядок, що вже з них складається, повертаємо без regex."""
+    # isdecimal() збігається з \d для str-шаблонів, тож результат той самий
+    if raw.isdecimal():
+        return raw
+    return _strip_non_digits(raw)
+
+
+@lru_cache(maxsize=4096)
+def _strip_non_digits(raw: str) -> str:
+    """Кешується, бо ті самі номери нормалізуються повторно."""
+    return _NON_DIGIT.sub("", raw)
+
+
+def _fmt_ddmmyyyy(d: date) -> str:
+    """DD.MM.YYYY без strftime."""
+    return f"{d.day:02d}.{d.month:02d}.{d.year:04d}"
+
+
+def _parse_ddmmyyyy(value: str) -> date:
+    """Розбирає D.M.YYYY / DD.MM.YYYY без strptime; діапазони перевіряє сам date()."""
+    if not value.isascii():
+        raise ValueError(value)
+    if len(value) == 10 and value[2] == "." and value[5] == ".":
+        # звичайний випадок DD.MM.YYYY — зрізи без split
+        day, month, year = value[:2], value[3:5], value[6:]
+    else:
+        parts = value.split(".")
+        if len(parts) != 3:
+            raise ValueError(value)
+        day, month, year = parts
+    if not (
+        0 < len(day) <= 2 and 0 < len(month) <= 2 and len(year) == 4
+        and day.isdecimal() and month.isdecimal() and year.isdecimal()
+    ):
+        raise ValueError(value)
+    return date(int(year), int(month), int(day))
+
 
 # ===================== МОДЕЛІ ДАНИХ =====================
 
@@ -30,7 +122,7 @@ class Name(Field):
 class Phone(Field):
     """10 цифр, зберігаємо тільки цифри."""
     def __init__(self, value):
-        digits = re.sub(r"\D", "", str(value))
+        digits = _normalize_phone(str(value))
         if len(digits) != 10:
             raise ValueError("Phone must contain exactly 10 digits")
         super().__init__(digits)
@@ -53,13 +145,13 @@ class Birthday(Field):
             return value.date()
         if isinstance(value, str):
             try:
-                return datetime.strptime(value.strip(), "%d.%m.%Y").date()
+                return _parse_ddmmyyyy(value.strip())
             except ValueError:
                 raise ValueError("Invalid date format. Use DD.MM.YYYY")
         raise ValueError("Invalid date format. Use DD.MM.YYYY")
 
     def __str__(self):
-        return self.value.strftime("%d.%m.%Y")
+        return _fmt_ddmmyyyy(self.value)
 
 
 class Record:
@@ -67,15 +159,30 @@ class Record:
     def __init__(self, name: str):
         self.name = Name(name)
         self.phones: list[Phone] = []
+        self._phone_index: set[str] = set()
         self.birthday: Birthday | None = None
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_phone_index", None)
+        return state
+
+    def __setstate__(self, state):
+        """Індекс телефонів не серіалізуємо — відновлюємо його зі списку."""
+        self.__dict__.update(state)
+        self._phone_index = {p.value for p in self.phones}
+
     def add_phone(self, phone: str):
         p = Phone(phone)
-        if not any(existing.value == p.value for existing in self.phones):
-            self.phones.append(p)
+        if p.value in self._phone_index:
+            return
+        self._phone_index.add(p.value)
+        self.phones.append(p)
 
     def find_phone(self, phone: str):
-        digits = re.sub(r"\D", "", str(phone))
+        digits = _normalize_phone(str(phone))
+        if digits not in self._phone_index:
+            return None
         for p in self.phones:
             if p.value == digits:
                 return p
@@ -85,17 +192,23 @@ class Record:
         target = self.find_phone(phone)
         if target:
             self.phones.remove(target)
+            self._phone_index.discard(target.value)
             return True
         return False
 
     def edit_phone(self, phone_old: str, phone_new: str) -> bool:
-        old_digits = re.sub(r"\D", "", str(phone_old))
+        old_digits = _normalize_phone(str(phone_old))
         new_p = Phone(phone_new)
+        if old_digits not in self._phone_index:
+            return False
         for i, p in enumerate(self.phones):
             if p.value == old_digits:
-                if any(x.value == new_p.value for x in self.phones):
+                duplicate = new_p.value in self._phone_index
+                self._phone_index.discard(old_digits)
+                if duplicate:
                     self.phones.pop(i)
                     return True
+                self._phone_index.add(new_p.value)
                 self.phones[i] = new_p
                 return True
         return False
@@ -108,28 +221,116 @@ class Record:
     def __str__(self):
         phones_str = "; ".join(p.value for p in self.phones) if self.phones else "-"
         bday_str = str(self.birthday) if self.birthday else "-"
+        return _RECORD_FMT(name=self.name.value, phones=phones_str, bday=bday_str)
+
+
+class AddressBook(dict):
+    """Колекція записів контактів.
+
+    Індекси імен для автодоповнення будуються ліниво при першому iter_names
+    і далі підтримуються всіма методами, що змінюють словник.
+    """
+    # None — індекс ще не побудовано (новий або щойно розпакований об'єкт)
+    _sorted_names: list[str] | None = None
+    _name_buckets: dict[str, list[str]] | None = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_sorted_names", None)
+        state.pop("_name_buckets", None)
+        return state
+
+    def __setstate__(self, state):
+        """Індекси імен не серіалізуємо — вони побудуються заново при потребі."""
+        state = dict(state)
+        # файли, збережені ще з UserDict, тримають записи в атрибуті data
+        self.update(state.pop("data", {}))
+        self.__dict__.update(state)
+
+    def __setitem__(self, name, record):
+        if self._sorted_names is not None and name not in self:
+            insort(self._sorted_names, name)
+            insort(self._name_buckets.setdefault(name[:2].lower(), []), name)
+        super().__setitem__(name, record)
+
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self._unindex_name(name)
+
+    def pop(self, name, *default):
+        if name in self:
+            record = self[name]
+            del self[name]
+            return record
+        return super().pop(name, *default)
+
+    def popitem(self):
+        name, record = super().popitem()
+        self._unindex_name(name)
+        return name, record
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def update(self, *args, **kwargs):
+        for name, record in dict(*args, **kwargs).items():
+            self[name] = record
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._sorted_names = self._name_buckets = None
+
+    def _build_name_index(self) -> None:
+        self._sorted_names = sorted(self)
+        # кошики за першими двома літерами (без регістру) для автодоповнення
+        self._name_buckets = {}
+        for name in self._sorted_names:
+            self._name_buckets.setdefault(name[:2].lower(), []).append(name)
+
+    def _unindex_name(self, name) -> None:
+        if self._sorted_names is None:
+            return
+        del self._sorted_names[bisect_left(self._sorted_names, name)]
+        key = name[:2].lower()
+        bucket = self._name_buckets[key]
+        del bucket[bisect_left(bucket, name)]
+        if not bucket:
+            del self._name_buckets[key]
 
-        return (
-            f"{Fore.CYAN}Contact name: {Fore.YELLOW}{self.name.value}{Style.RESET_ALL},\n"
-            f"{Fore.CYAN}phones: {Fore.GREEN}{phones_str}{Style.RESET_ALL},\n"
-            f"{Fore.CYAN}birthday: {Fore.MAGENTA}{bday_str}{Style.RESET_ALL}"
-        )
-
-
-class AddressBook(UserDict):
-    """Колекція записів контактів."""
     def add_record(self, record: Record) -> None:
-        self.data[record.name.value] = record
+        self[record.name.value] = record
 
     def find(self, name: str):
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name: str) -> bool:
-        if name in self.data:
-            del self.data[name]
+        if name in self:
+            del self[name]
             return True
         return False
 
+    def iter_names(self, prefix: str = ""):
+        """Імена контактів, що починаються з prefix, у відсортованому порядку."""
+        if self._sorted_names is None:
+            self._build_name_index()
+        if len(prefix) >= 2:
+            # усі збіги лежать в одному кошику, переглядаємо лише його
+            for name in self._name_buckets.get(prefix[:2].lower(), ()):
+                if name.startswith(prefix):
+                    yield name
+            return
+        names = self._sorted_names
+        for i in range(bisect_left(names, prefix), len(names)):
+            if not names[i].startswith(prefix):
+                break
+            yield names[i]
+
     def get_upcoming_birthdays(self) -> list[dict]:
         """
         Повертає список словників:
@@ -137,39 +338,162 @@ class AddressBook(UserDict):
         для ДН у найближчі 7 днів. Вітання з вихідних переносимо на понеділок.
         """
         today = date.today()
-        result = []
-
-        for record in self.data.values():
-            if not record.birthday:
-                continue
-            bday: date = record.birthday.value
-
-            candidate = date(today.year, bday.month, bday.day)
-            if candidate < today:
-                candidate = date(today.year + 1, bday.month, bday.day)
-
-            delta_days = (candidate - today).days
-            if 0 <= delta_days < 7:
-                congrats = candidate
-                if congrats.weekday() >= 5:  # 5=субота, 6=неділя
-                    congrats += timedelta(days=(7 - congrats.weekday()))
-                result.append({
-                    "name": record.name.value,
-                    "congratulation_date": congrats.strftime("%d.%m.%Y")
-                })
-
-        return sorted(
-            result,
-            key=lambda x: datetime.strptime(x["congratulation_date"], "%d.%m.%Y").date()
+        records = [record for record in self.values() if record.birthday]
+
+        if len(records) >= _VECTORIZE_MIN_RECORDS and _get_np() is not None:
+            upcoming = _upcoming_vectorized(records, today)
+        else:
+            upcoming = _upcoming_scalar(records, today)
+
+        # сортуємо за ордіналом, без повторного парсингу рядків
+        upcoming.sort(key=itemgetter(0))
+        return [
+            {
+                "name": record.name.value,
+                "congratulation_date": _fmt_ddmmyyyy(date.fromordinal(cand_ord))
+            }
+            for cand_ord, record in upcoming
+        ]
+
+
+def _upcoming_scalar(records: list[Record], today: date) -> list[tuple[int, Record]]:
+    """Повертає пари (ордінал дати привітання, запис) для ДН у найближчі 7 днів."""
+    today_year = today.year
+    today_ord = today.toordinal()
+    upcoming = []
+
+    for record in records:
+        bday: date = record.birthday.value
+
+        cand_ord = date(today_year, bday.month, bday.day).toordinal()
+        if cand_ord < today_ord:
+            cand_ord = date(today_year + 1, bday.month, bday.day).toordinal()
+
+        if cand_ord - today_ord < 7:
+            # ордінал 1 (01.01.0001) — понеділок, тож weekday = (ord + 6) % 7
+            weekday = (cand_ord + 6) % 7
+            if weekday >= 5:  # 5=субота, 6=неділя
+                cand_ord += 7 - weekday
+            upcoming.append((cand_ord, record))
+
+    return upcoming
+
+
+@lru_cache(maxsize=None)
+def _get_np():
+    """Імпортує numpy при першій потребі; None, якщо numpy не встановлено."""
+    try:
+        import numpy
+    except ImportError:  # numpy необов'язковий: без нього працює звичайний цикл
+        return None
+    return numpy
+
+
+def _year_ordinals(months, days, year: int, feb29):
+    """Ордінали дат (year, month, day) для масивів місяців і днів."""
+    leap = isleap(year)
+    if not leap and feb29.any():
+        date(year, 2, 29)  # кидає той самий ValueError, що й скалярний шлях
+    year_start = date(year, 1, 1).toordinal() - 1
+    np = _get_np()
+    return year_start + np.take(_MONTH_START, months) + days + (leap & (months > 2))
+
+
+def _upcoming_vectorized(records: list[Record], today: date) -> list[tuple[int, Record]]:
+    """Те саме, що _upcoming_scalar, але одним проходом по масивах numpy."""
+    np = _get_np()
+    count = len(records)
+    months = np.fromiter((r.birthday.value.month for r in records), dtype=np.int64, count=count)
+    days = np.fromiter((r.birthday.value.day for r in records), dtype=np.int64, count=count)
+    today_ord = today.toordinal()
+
+    kernel = _get_jit_kernel() if count >= _JIT_MIN_RECORDS else None
+    if kernel is not None:
+        year, next_year = today.year, today.year + 1
+        indices = np.empty(count, dtype=np.int64)
+        congrat_ords = np.empty(count, dtype=np.int64)
+        found = kernel(
+            months, days, today_ord,
+            date(year, 1, 1).toordinal() - 1, isleap(year),
+            date(next_year, 1, 1).toordinal() - 1, isleap(next_year),
+            np.array(_MONTH_START, dtype=np.int64),
+            indices, congrat_ords,
         )
+        return [(int(congrat_ords[k]), records[indices[k]]) for k in range(found)]
+
+    feb29 = (months == 2) & (days == 29)
+
+    cand = _year_ordinals(months, days, today.year, feb29)
+    passed = cand < today_ord
+    if passed.any():
+        next_year = _year_ordinals(months, days, today.year + 1, feb29 & passed)
+        cand = np.where(passed, next_year, cand)
+
+    mask = cand - today_ord < 7
+    weekday = (cand + 6) % 7
+    cand = cand + np.where(weekday >= 5, 7 - weekday, 0)
+    return [(int(cand[i]), records[i]) for i in np.flatnonzero(mask)]
+
+
+def _upcoming_kernel(months, days, today_ord, year_start, leap,
+                     next_year_start, next_leap, month_start, indices, congrat_ords):
+    """Цикл для numba: заповнює indices/congrat_ords і повертає кількість збігів."""
+    found = 0
+    for i in range(months.shape[0]):
+        month = months[i]
+        day = days[i]
+        if month == 2 and day == 29 and not leap:
+            raise ValueError("day is out of range for month")
+        cand = year_start + month_start[month] + day
+        if leap and month > 2:
+            cand += 1
+        if cand < today_ord:
+            if month == 2 and day == 29 and not next_leap:
+                raise ValueError("day is out of range for month")
+            cand = next_year_start + month_start[month] + day
+            if next_leap and month > 2:
+                cand += 1
+        if cand - today_ord < 7:
+            weekday = (cand + 6) % 7
+            if weekday >= 5:  # 5=субота, 6=неділя
+                cand += 7 - weekday
+            indices[found] = i
+            congrat_ords[found] = cand
+            found += 1
+    return found
+
+
+@lru_cache(maxsize=None)
+def _get_jit_kernel():
+    """Компілює _upcoming_kernel при першій потребі; None, якщо numba не встановлено."""
+    try:
+        from numba import njit
+    except ImportError:  # numba необов'язковий: без нього рахуємо на numpy
+        return None
+    return njit(cache=True)(_upcoming_kernel)
 
 
 # ===================== ЗБЕРЕЖЕННЯ / ЗАВАНТАЖЕННЯ (pickle) =====================
 
+_SAVE_BUFFER_SIZE = 1 << 20
+
 def save_data(book: AddressBook, filename: str = "addressbook.pkl"):
-    """Серіалізація AddressBook у файл."""
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+    """Серіалізація AddressBook у файл.
+
+    Пишемо у тимчасовий файл і атомарно підміняємо ним основний,
+    щоб збій посеред запису не зіпсував збережену книгу.
+    """
+    tmp = filename + ".tmp"
+    try:
+        with open(tmp, "wb", buffering=_SAVE_BUFFER_SIZE) as f:
+            pickle.dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filename)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp)
+        raise
 
 
 def load_data(filename: str = "addressbook.pkl") -> AddressBook:
@@ -184,17 +508,17 @@ def load_data(filename: str = "addressbook.pkl") -> AddressBook:
 # ===================== ДЕКОРАТОР ТА ХЕНДЛЕРИ =====================
 
 def input_error(func):
+    """Перетворює помилки введення на повідомлення; інші винятки не ховаємо."""
+    @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except IndexError:
-            return Fore.RED + "Недостатньо аргументів для цієї команди." + Style.RESET_ALL
+            return MSG_NOT_ENOUGH_ARGS
         except KeyError as e:
-            return Fore.RED + f"Не знайдено: {e}" + Style.RESET_ALL
+            return f"{Fore.RED}Не знайдено: {e}{Style.RESET_ALL}"
         except ValueError as e:
-            return Fore.RED + str(e) + Style.RESET_ALL
-        except Exception as e:
-            return Fore.RED + f"Сталася помилка: {e}" + Style.RESET_ALL
+            return f"{Fore.RED}{e}{Style.RESET_ALL}"
     return wrapper
 
 
@@ -206,11 +530,11 @@ def add_contact(args, book: AddressBook):
         return msg
     name, phone, *_ = args
     record = book.find(name)
-    message = Fore.YELLOW + "Contact updated." + Style.RESET_ALL
+    message = MSG_CONTACT_UPDATED
     if record is None:
         record = Record(name)
         book.add_record(record)
-        message = Fore.GREEN + "Contact added." + Style.RESET_ALL
+        message = MSG_CONTACT_ADDED
     if phone:
         record.add_phone(phone)
     return message
@@ -225,13 +549,12 @@ def change(args, book: AddressBook):
     name, old, new = args[0], args[1], args[2]
     rec = book.find(name)
     if rec is None:
-        return Fore.RED + "Контакт не знайдено." + Style.RESET_ALL
+        return MSG_CONTACT_NOT_FOUND
     if rec.edit_phone(old, new):
-        return Fore.GREEN + "Номер змінено." + Style.RESET_ALL
-    return Fore.RED + "Старий номер не знайдено." + Style.RESET_ALL
+        return MSG_PHONE_CHANGED
+    return MSG_OLD_PHONE_NOT_FOUND
 
 
-@input_error
 def phone(args, book: AddressBook):
     """phone [ім'я]"""
     msg = need("phone", args, 1)
@@ -240,23 +563,19 @@ def phone(args, book: AddressBook):
     name = args[0]
     rec = book.find(name)
     if rec is None:
-        return Fore.RED + "Контакт не знайдено." + Style.RESET_ALL
+        return MSG_CONTACT_NOT_FOUND
     if not rec.phones:
-        return Fore.YELLOW + "У контакта немає телефонів." + Style.RESET_ALL
-    return Fore.GREEN + ", ".join(p.value for p in rec.phones) + Style.RESET_ALL
+        return MSG_NO_PHONES
+    return f"{Fore.GREEN}{', '.join(p.value for p in rec.phones)}{Style.RESET_ALL}"
 
 
-@input_error
 def show_all(args, book: AddressBook):
     msg = need("all", args, 0)
     if msg:
         return msg
-    if not book.data:
-        return Fore.YELLOW + "Адресна книга порожня." + Style.RESET_ALL
-    lines = []
-    for rec in book.data.values():
-        lines.append(str(rec))
-    return "\n\n".join(lines)
+    if not book:
+        return MSG_BOOK_EMPTY
+    return "\n\n".join(str(rec) for rec in book.values())
 
 
 @input_error
@@ -268,16 +587,11 @@ def add_birthday(args, book: AddressBook):
     name, bday = args[0], args[1]
     rec = book.find(name)
     if rec is None:
-        return (
-            Fore.RED
-            + "Контакт не знайдено. Спочатку додайте контакт командою: add [ім'я] [телефон]"
-            + Style.RESET_ALL
-        )
+        return MSG_CONTACT_NOT_FOUND_ADD_FIRST
     rec.add_birthday(bday)
-    return Fore.GREEN + f"День народження для {name} додано." + Style.RESET_ALL
+    return f"{Fore.GREEN}День народження для {name} додано.{Style.RESET_ALL}"
 
 
-@input_error
 def show_birthday(args, book: AddressBook):
     """show-birthday [ім'я]"""
     msg = need("show-birthday", args, 1)
@@ -286,10 +600,10 @@ def show_birthday(args, book: AddressBook):
     name = args[0]
     rec = book.find(name)
     if rec is None:
-        return Fore.RED + "Контакт не знайдено." + Style.RESET_ALL
+        return MSG_CONTACT_NOT_FOUND
     if not rec.birthday:
-        return Fore.YELLOW + "День народження не встановлено." + Style.RESET_ALL
-    return Fore.GREEN + str(rec.birthday) + Style.RESET_ALL
+        return MSG_BIRTHDAY_NOT_SET
+    return f"{Fore.GREEN}{rec.birthday}{Style.RESET_ALL}"
 
 
 @input_error
@@ -300,13 +614,14 @@ def birthdays(args, book: AddressBook):
         return msg
     schedule = book.get_upcoming_birthdays()
     if not schedule:
-        return Fore.YELLOW + "Найближчого тижня немає днів народження." + Style.RESET_ALL
+        return MSG_NO_UPCOMING_BIRTHDAYS
     # згрупуємо по даті
     by_date = {}
     for item in schedule:
         by_date.setdefault(item["congratulation_date"], []).append(item["name"])
     lines = []
-    for d in sorted(by_date, key=lambda s: datetime.strptime(s, "%d.%m.%Y").date()):
+    # schedule вже відсортований за датою, тож by_date зберігає хронологічний порядок
+    for d in by_date:
         lines.append(
             f"{Fore.CYAN}{d}:{Style.RESET_ALL} {Fore.GREEN}{', '.join(by_date[d])}{Style.RESET_ALL}"
         )
@@ -314,11 +629,11 @@ def birthdays(args, book: AddressBook):
 
 
 def hello(args, book):
-    return Fore.CYAN + "Вітаю! Чим можу допомогти?" + Style.RESET_ALL
+    return MSG_HELLO
 
 
 def exit_cmd(args, book):
-    return Fore.CYAN + "До зустрічі!" + Style.RESET_ALL
+    return MSG_BYE
 
 
 # ===== ПІДКАЗКИ ДЛЯ КОМАНД =====
@@ -335,16 +650,19 @@ USAGE = {
     "exit": "Використання: exit",
 }
 
+_NEED_MSG = {
+    cmd: f"{Fore.RED}Недостатньо аргументів.\n{usage}{Style.RESET_ALL}"
+    for cmd, usage in USAGE.items()
+}
+_NEED_MSG_DEFAULT = (
+    f"{Fore.RED}Недостатньо аргументів.\nНемає підказки для цієї команди.{Style.RESET_ALL}"
+)
+
 
 def need(cmd: str, args: list, n_required: int):
     """Повертає текст підказки, якщо аргументів менше ніж потрібно."""
     if len(args) < n_required:
-        return (
-            Fore.RED
-            + "Недостатньо аргументів.\n"
-            + USAGE.get(cmd, "Немає підказки для цієї команди.")
-            + Style.RESET_ALL
-        )
+        return _NEED_MSG.get(cmd) or _NEED_MSG_DEFAULT
     return None
 
 
@@ -363,14 +681,19 @@ COMMANDS = {
     "exit": exit_cmd,
 }
 
+MSG_UNKNOWN_COMMAND = (
+    f"{Fore.RED}Невідома команда.\nМожливі команди: {', '.join(COMMANDS)}{Style.RESET_ALL}"
+)
+
 NAME_ARG_COMMANDS = {"add", "change", "phone", "add-birthday", "show-birthday"}
 
 def parse_command(line: str):
-    parts = line.strip().split()
+    # відокремлюємо лише команду, аргументи ділимо тільки якщо вони є
+    parts = line.split(None, 1)
     if not parts:
         return None, []
     cmd = parts[0].lower()
-    args = parts[1:]
+    args = parts[1].split() if len(parts) > 1 else []
     return cmd, args
 
 
@@ -379,6 +702,7 @@ def parse_command(line: str):
 class BotCompleter(Completer):
     def __init__(self, book: AddressBook):
         self.book = book
+        self._sorted_cmds = sorted(COMMANDS.keys())
 
     def get_completions(self, document, complete_event):
         text = document.text_before_cursor
@@ -387,7 +711,7 @@ class BotCompleter(Completer):
 
         if not words:
             # нічого не введено — показуємо всі команди
-            options = sorted(COMMANDS.keys())
+            options = self._sorted_cmds
             prefix = ""
         else:
             current_word = document.get_word_under_cursor() or ""
@@ -403,14 +727,15 @@ class BotCompleter(Completer):
 
             if word_index == 0:
                 # перше слово → команди
-                options = COMMANDS.keys()
+                options = self._sorted_cmds
                 prefix = current_word
 
             elif word_index == 1:
                 # друге слово:
                 # тільки для команд, що приймають ім'я
                 if cmd in NAME_ARG_COMMANDS:
-                    options = self.book.data.keys()
+                    # бінарний пошук по відсортованих іменах книги
+                    options = self.book.iter_names(current_word)
                 else:
                     options = []
                 prefix = current_word
@@ -420,7 +745,7 @@ class BotCompleter(Completer):
                 options = []
                 prefix = current_word
 
-        for opt in sorted(set(options)):
+        for opt in options:
             if opt.startswith(prefix):
                 yield Completion(opt, start_position=-len(prefix))
 
@@ -468,12 +793,7 @@ def main():
             continue
         handler = COMMANDS.get(cmd)
         if not handler:
-            print(
-                Fore.RED
-                + "Невідома команда.\nМожливі команди: "
-                + ", ".join(COMMANDS.keys())
-                + Style.RESET_ALL
-            )
+            print(MSG_UNKNOWN_COMMAND)
             continue
 
         result = handler(args, book)